@@ -63,7 +63,8 @@ def create_app(config_name='development'):
              'X-CSRF-Token'
          ],
          methods=['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS', 'PATCH'],
-             supports_credentials=True)
+             supports_credentials=True,
+             max_age=86400)
     else:
         # In production, don't use CORS extension - rely on after_request headers
         pass
@@ -5,7 +5,6 @@ This script handles the initial authentication process
 """
 
 import asyncio
-import os
 import sys
 from dotenv import load_dotenv
 
@@ -15,7 +14,7 @@ load_dotenv()
 async def authenticate_telegram():
     """Authenticate with Telegram using phone number"""
     try:
-        from services.telegram_scraper import TelegramScraper
+        from services.telegram_scraper import TelegramScraper, get_telegram_credentials
         
         print("Telegram Authentication")
         print("=" * 30)
@@ -25,9 +24,10 @@ async def authenticate_telegram():
         scraper = TelegramScraper()
         
         # Check credentials
-        api_id = os.environ.get('TELEGRAM_API_ID')
-        api_hash = os.environ.get('TELEGRAM_API_HASH')
-        phone = os.environ.get('TELEGRAM_PHONE_NUMBER')
+        creds = get_telegram_credentials()
+        api_id = creds['TELEGRAM_API_ID']
+        api_hash = creds['TELEGRAM_API_HASH']
+        phone = creds['TELEGRAM_PHONE_NUMBER']
         
         if not api_id or not api_hash or not phone:
             print("ERROR: Missing Telegram credentials!")
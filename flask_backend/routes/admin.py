@@ -5,12 +5,12 @@ from flask import Blueprint, jsonify, request
 from auth import require_auth, require_role
 from models.user import SystemUser, User
 from models.source import Source
-from models.keyword import Keyword
-from models.content import Content
-from models.case import Case
+from models.keyword import Keyword, KeywordStatus
+from models.content import Content, ContentStatus, RiskLevel
+from models.case import Case, CaseStatus
 from models.osint_result import OSINTResult
 from extensions import db
-from sqlalchemy import func
+from sqlalchemy import func, case as sql_case
 from datetime import datetime, timedelta
 import json
 
@@ -184,10 +184,17 @@ def manage_sources():
             sources = Source.query.all()
             sources_data = []
             
+            # Count users and content for every source in two grouped queries
+            user_counts = dict(
+                db.session.query(User.source_id, func.count(User.id)).group_by(User.source_id).all()
+            )
+            content_counts = dict(
+                db.session.query(Content.source_id, func.count(Content.id)).group_by(Content.source_id).all()
+            )
+            
             for source in sources:
-                # Count users and content for this source
-                user_count = User.query.filter_by(source_id=source.id).count() if hasattr(User, 'source_id') else 0
-                content_count = Content.query.filter_by(source_id=source.id).count() if hasattr(Content, 'source_id') else 0
+                user_count = user_counts.get(source.id, 0)
+                content_count = content_counts.get(source.id, 0)
                 
                 sources_data.append({
                     'id': source.id,
@@ -392,30 +399,43 @@ def toggle_keyword(keyword_id):
 def get_data_stats():
     """Get comprehensive data statistics"""
     try:
+        # One conditional-aggregate query per table; COUNT over an empty
+        # table is already 0, so no existence probe is needed
+        
         # Platform Users Stats
-        platform_users_total = User.query.count() if User.query.first() else 0
-        platform_users_flagged = User.query.filter_by(is_flagged=True).count() if User.query.first() else 0
+        platform_users_total, platform_users_flagged = db.session.query(
+            func.count(User.id),
+            func.count(sql_case((User.is_flagged == True, 1)))
+        ).one()
         platform_users_active = platform_users_total - platform_users_flagged
         
         # Sources Stats
-        sources_total = Source.query.count() if Source.query.first() else 0
-        sources_active = Source.query.filter_by(is_active=True).count() if Source.query.first() else 0
+        sources_total, sources_active = db.session.query(
+            func.count(Source.id),
+            func.count(sql_case((Source.is_active == True, 1)))
+        ).one()
         
         # Keywords Stats
-        keywords_total = Keyword.query.count() if Keyword.query.first() else 0
-        keywords_active = Keyword.query.filter_by(is_active=True).count() if Keyword.query.first() else 0
+        keywords_total, keywords_active = db.session.query(
+            func.count(Keyword.id),
+            func.count(sql_case((Keyword.status == KeywordStatus.ACTIVE, 1)))
+        ).one()
         
         # Content Stats
-        content_total = Content.query.count() if Content.query.first() else 0
-        content_high_risk = Content.query.filter_by(risk_level='High').count() if Content.query.first() else 0
-        content_pending = Content.query.filter_by(status='Pending').count() if Content.query.first() else 0
+        content_total, content_high_risk, content_pending = db.session.query(
+            func.count(Content.id),
+            func.count(sql_case((Content.risk_level == RiskLevel.HIGH, 1))),
+            func.count(sql_case((Content.status == ContentStatus.PENDING, 1)))
+        ).one()
         content_analyzed = content_total - content_pending
         
         # Cases Stats
-        cases_total = Case.query.count() if Case.query.first() else 0
-        cases_active = Case.query.filter_by(status='Open').count() if Case.query.first() else 0
-        cases_pending = Case.query.filter_by(status='Pending').count() if Case.query.first() else 0
-        cases_closed = Case.query.filter_by(status='Closed').count() if Case.query.first() else 0
+        cases_total, cases_active, cases_pending, cases_closed = db.session.query(
+            func.count(Case.id),
+            func.count(sql_case((Case.status == CaseStatus.OPEN, 1))),
+            func.count(sql_case((Case.status == CaseStatus.PENDING, 1))),
+            func.count(sql_case((Case.status == CaseStatus.CLOSED, 1)))
+        ).one()
         
         return jsonify({
             'platformUsers': {
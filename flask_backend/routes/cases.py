@@ -221,6 +221,15 @@ def link_content_to_case(case_id):
         content_ids = data.get('content_ids', [])
         if not isinstance(content_ids, list) or not content_ids:
             return jsonify({'status': 'error', 'message': 'content_ids (non-empty list) required'}), 400
+        # Accept ints and digit strings only; int() would also take floats
+        # (5.7 -> 5) and booleans (True -> 1)
+        if not all(
+            (isinstance(content_id, int) and not isinstance(content_id, bool))
+            or (isinstance(content_id, str) and content_id.isascii() and content_id.isdigit())
+            for content_id in content_ids
+        ):
+            return jsonify({'status': 'error', 'message': 'content_ids must be integers'}), 400
+        content_ids = [int(content_id) for content_id in content_ids]
         success, message, created = case_service.link_content_to_case(case_id, content_ids)
         if not success:
             return jsonify({'status': 'error', 'message': message}), 400
@@ -3,7 +3,7 @@ from models.content import Content
 from models.source import Source
 from models.osint_result import OSINTResult
 from extensions import db
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, select
 from datetime import datetime, timedelta
 
 dashboard_bp = Blueprint('dashboard', __name__)
@@ -32,11 +32,23 @@ def get_dashboard_stats():
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        # Content statistics
-        total_content = Content.query.count()
-        recent_content = Content.query.filter(
-            Content.created_at >= start_date
-        ).count()
+        # Content, source and OSINT counts in a single round-trip
+        counts = db.session.execute(select(
+            select(func.count(Content.id)).scalar_subquery(),
+            select(func.count(Content.id)).where(
+                Content.created_at >= start_date
+            ).scalar_subquery(),
+            select(func.count(Source.id)).scalar_subquery(),
+            select(func.count(Source.id)).where(
+                Source.is_active == True
+            ).scalar_subquery(),
+            select(func.count(OSINTResult.id)).scalar_subquery(),
+            select(func.count(OSINTResult.id)).where(
+                OSINTResult.created_at >= start_date
+            ).scalar_subquery()
+        )).one()
+        (total_content, recent_content, total_sources, active_sources,
+         total_osint_searches, recent_osint_searches) = counts
         
         # Risk level distribution
         risk_distribution = db.session.query(
@@ -44,16 +56,6 @@ def get_dashboard_stats():
             func.count(Content.id)
         ).group_by(Content.risk_level).all()
         
-        # Source statistics
-        total_sources = Source.query.count()
-        active_sources = Source.query.filter_by(is_active=True).count()
-        
-        # OSINT statistics
-        total_osint_searches = OSINTResult.query.count()
-        recent_osint_searches = OSINTResult.query.filter(
-            OSINTResult.created_at >= start_date
-        ).count()
-        
         # Content by source
         content_by_source = db.session.query(
             Source.name,
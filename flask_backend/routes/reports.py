@@ -6,6 +6,7 @@ from flask import Blueprint, request, jsonify, send_file, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from werkzeug.exceptions import NotFound, BadRequest
 from datetime import datetime
+from sqlalchemy import select, bindparam, exists
 
 from extensions import db
 from models.case import Case
@@ -20,6 +21,22 @@ from models.user_case_link import UserCaseLink
 # Create blueprint
 reports_bp = Blueprint('reports', __name__, url_prefix='/api/reports')
 
+# Built once; the expanding "ids" parameter keeps one cached statement
+# for any number of ids
+_CONTENT_BY_IDS = select(Content).where(Content.id.in_(bindparam('ids', expanding=True)))
+
+
+def _get_content_by_ids(content_ids):
+    """Load the Content rows for a list of ids"""
+    return db.session.execute(_CONTENT_BY_IDS, {'ids': content_ids}).scalars().all()
+
+
+def _user_has_case_access(user_id, case_id):
+    """Whether a user is linked to a case, checked with SELECT EXISTS"""
+    return db.session.query(
+        exists().where(UserCaseLink.user_id == user_id, UserCaseLink.case_id == case_id)
+    ).scalar()
+
 
 @reports_bp.route('/<int:case_id>/generate', methods=['GET'])
 @jwt_required()
@@ -47,7 +64,7 @@ def generate_case_report(case_id):
             return jsonify({'error': f'Case with ID {case_id} not found'}), 404
         
         # Enforce user access: analyst must be linked to the case
-        if not db.session.query(UserCaseLink).filter_by(user_id=current_user.id, case_id=case_id).first():
+        if not _user_has_case_access(current_user.id, case_id):
             return jsonify({'error': 'You do not have access to this case'}), 403
         
         # Generate the report
@@ -70,7 +87,7 @@ def generate_case_report(case_id):
             content_items = None
             if content_links:
                 content_ids = [link.content_id for link in content_links]
-                content_items = Content.query.filter(Content.id.in_(content_ids)).all()
+                content_items = _get_content_by_ids(content_ids)
             
             # Generate PDF using Narcotics Intelligence Platform format
             pdf_buffer = generate_case_pdf_report(
@@ -128,7 +145,7 @@ def preview_case_report(case_id):
         if not case:
             return jsonify({'error': f'Case with ID {case_id} not found'}), 404
         # Ensure linkage
-        if not db.session.query(UserCaseLink).filter_by(user_id=current_user.id, case_id=case_id).first():
+        if not _user_has_case_access(current_user.id, case_id):
             return jsonify({'error': 'You do not have access to this case'}), 403
         
         # Get case data for preview
@@ -139,7 +156,7 @@ def preview_case_report(case_id):
         content_items = None
         if content_links:
             content_ids = [link.content_id for link in content_links]
-            content_items = Content.query.filter(Content.id.in_(content_ids)).all()
+            content_items = _get_content_by_ids(content_ids)
         
         # Get OSINT results
         osint_results = OSINTResult.query.filter_by(case_id=case_id).all()
@@ -449,7 +466,7 @@ def generate_detailed_case_report(case_id):
             content_links = db.session.query(CaseContentLink).filter_by(case_id=case_id).all()
             if content_links:
                 content_ids = [link.content_id for link in content_links]
-                content_items = Content.query.filter(Content.id.in_(content_ids)).all()
+                content_items = _get_content_by_ids(content_ids)
         
         # Generate PDF using Narcotics Intelligence Platform format
         pdf_buffer = generate_case_pdf_report(
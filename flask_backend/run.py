@@ -2,14 +2,19 @@
 Flask server runner - works for both local development and production
 """
 import os
+import shutil
+import sys
 from app import create_app
 
 # Determine environment
 is_production = os.getenv('FLASK_ENV') == 'production' or os.getenv('RENDER') == 'true'
 config_name = 'production' if is_production else 'development'
 
-# Create Flask app
-app = create_app(config_name)
+# Create the Flask app when imported as a WSGI module (gunicorn run:app).
+# When run as a script it is created below, only on the paths that serve it
+# from this process; the gunicorn path builds its own from wsgi:app.
+if __name__ != '__main__':
+    app = create_app(config_name)
 
 if __name__ == '__main__':
     if is_production:
@@ -18,10 +23,29 @@ if __name__ == '__main__':
         print(f"🚀 Starting Flask Production Server on port {port}")
         print(f"🗄️  Database: {os.getenv('DATABASE_URL', 'SQLite')}")
         
+        # Serve through gunicorn like the Procfile does: one worker (in-memory
+        # job state is per process) with a thread pool for concurrent requests
+        gunicorn = shutil.which('gunicorn')
+        if gunicorn:
+            # execv replaces this process; flush the banner so it reaches the logs
+            sys.stdout.flush()
+            os.execv(gunicorn, [
+                'gunicorn', 'wsgi:app',
+                '--chdir', os.path.dirname(os.path.abspath(__file__)),
+                '--bind', f'0.0.0.0:{port}',
+                '--workers', os.getenv('WEB_CONCURRENCY', '1'),
+                '--worker-class', 'gthread',
+                '--threads', os.getenv('GUNICORN_THREADS', '8'),
+                '--timeout', '300'
+            ])
+        
+        print("⚠️  gunicorn not found, falling back to the Flask server")
+        app = create_app(config_name)
         app.run(
             host='0.0.0.0',  # Must bind to 0.0.0.0 for production
             port=port,
-            debug=False
+            debug=False,
+            threaded=True
         )
     else:
         # Development settings
@@ -46,6 +70,7 @@ if __name__ == '__main__':
         print()
         
         # Run development server
+        app = create_app(config_name)
         app.run(
             host='127.0.0.1',  # localhost only for development
             port=5000,
@@ -410,14 +410,24 @@ class CaseService:
             if not case:
                 return False, "Case not found", 0
             
+            # Resolve which content exists and which is already linked with one
+            # query each, instead of two lookups per content id
+            known_ids = {
+                content_id for (content_id,) in db.session.query(Content.id)
+                .filter(Content.id.in_(content_ids)).all()
+            }
+            linked_ids = {
+                content_id for (content_id,) in db.session.query(CaseContentLink.content_id)
+                .filter(CaseContentLink.case_id == case_id, CaseContentLink.content_id.in_(content_ids)).all()
+            }
+            
             for content_id in content_ids:
-                content = Content.query.get(content_id)
-                if not content:
+                if content_id not in known_ids:
                     continue
                 # Skip if link exists
-                existing = CaseContentLink.query.filter_by(case_id=case_id, content_id=content_id).first()
-                if existing:
+                if content_id in linked_ids:
                     continue
+                linked_ids.add(content_id)
                 link = CaseContentLink(case_id=case_id, content_id=content_id)
                 db.session.add(link)
                 created += 1
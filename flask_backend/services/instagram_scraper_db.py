@@ -2,6 +2,7 @@
 Instagram scraping service that persists data to the database
 """
 import logging
+from functools import lru_cache
 from typing import Dict, List, Any
 from datetime import datetime
 
@@ -14,16 +15,33 @@ from extensions import db
 from models.source import Source, PlatformType, SourceType
 from models.user import User
 from models.content import Content, ContentType, RiskLevel
-from services.keyword_detector import KeywordDetector
+from services.keyword_detector import get_keyword_detector, risk_band
 
 logger = logging.getLogger(__name__)
 
+# RiskLevel for each keyword_detector.risk_band() index
+RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+
+@lru_cache(maxsize=1024)
+def _analyze_caption(text: str, keywords_version: int) -> Dict[str, Any]:
+    """
+    Keyword analysis of a caption, memoized by text
+
+    Re-scraping a profile or hashtag returns mostly the same captions, so
+    repeated texts skip the regex scan. The detector's keywords version is
+    part of the key, so adding or removing keywords on the shared detector
+    bypasses older entries. The result is shared between callers and must
+    not be mutated.
+    """
+    return get_keyword_detector().analyze_content(text)
+
 
 class InstagramScraperDB:
     """Instagram scraper that saves data to the database"""
 
     def __init__(self):
-        self.detector = KeywordDetector()
+        self.detector = get_keyword_detector()
         if instaloader is not None:
             self.loader = instaloader.Instaloader(
                 download_pictures=False,
@@ -75,48 +93,51 @@ class InstagramScraperDB:
                 user.bio = bio
         return user
 
-    def _analyze_and_save_content(self, source: Source, text: str, author: str, url: str = None) -> Dict[str, Any]:
+    def _build_content(self, source: Source, text: str, author: str, url: str = None) -> Content:
         # Analyze content for keywords and risk
-        analysis = self.detector.analyze_content(text or "")
+        analysis = _analyze_caption(text or "", get_keyword_detector().keywords_version)
         suspicion_score = max(0, min(int(analysis.get("risk_score", 0)), 100))
-        
-        # Determine risk level
-        if suspicion_score >= 50:
-            risk_level = RiskLevel.CRITICAL
-        elif suspicion_score >= 30:
-            risk_level = RiskLevel.HIGH
-        elif suspicion_score >= 15:
-            risk_level = RiskLevel.MEDIUM
-        else:
-            risk_level = RiskLevel.LOW
 
-        # Save content to database
-        content = Content(
+        # Build the content row; it is inserted with the rest of the batch
+        return Content(
             source_id=source.id,
             text=text or "",
             url=url or "",
             author=author or "Unknown",
             content_type=ContentType.TEXT,
-            risk_level=risk_level,
-            keywords=analysis.get("keywords", []),
+            risk_level=RISK_LEVELS[risk_band(suspicion_score)],
+            # The cached analysis is shared between posts, so each row gets
+            # its own copies of the mutable parts
+            keywords=list(analysis.get("keywords", [])),
             analysis_summary=analysis.get("analysis", ""),
             analysis_data={
                 "suspicion_score": suspicion_score,
-                "category_details": analysis.get("category_details", {}),
-                "match_counts": analysis.get("match_counts", {}),
+                "category_details": {
+                    category: list(words)
+                    for category, words in analysis.get("category_details", {}).items()
+                },
+                "match_counts": dict(analysis.get("match_counts", {})),
                 "platform": "Instagram"
             }
         )
-        db.session.add(content)
+
+    def _save_contents(self, contents: List[Content], scraped_at: datetime) -> List[Dict[str, Any]]:
+        """Insert a batch of content rows with one flush and describe them"""
+        db.session.add_all(contents)
         db.session.flush()
 
-        return {
-            "content_id": content.id,
-            "text_content": content.text,
-            "suspicion_score": suspicion_score,
-            "posted_at": datetime.utcnow().isoformat(),
-            "analysis": analysis.get("analysis", "")
-        }
+        posted_at = scraped_at.isoformat()
+
+        return [
+            {
+                "content_id": content.id,
+                "text_content": content.text,
+                "suspicion_score": content.analysis_data["suspicion_score"],
+                "posted_at": posted_at,
+                "analysis": content.analysis_summary
+            }
+            for content in contents
+        ]
 
     def scrape_user_posts(self, username: str, max_posts: int = 10) -> Dict[str, Any]:
         """Scrape Instagram user posts and save to database"""
@@ -152,33 +173,34 @@ class InstagramScraperDB:
             )
 
             # Scrape posts
-            posts_data = []
-            count = 0
+            contents = []
             
             for post in profile.get_posts():
-                if count >= max_posts:
+                if len(contents) >= max_posts:
                     break
                     
                 try:
                     caption = post.caption or ""
                     post_url = f"https://www.instagram.com/p/{post.shortcode}/"
                     
-                    # Save content and get analysis
-                    content_data = self._analyze_and_save_content(
+                    # Analyze the post; rows are saved together below
+                    contents.append(self._build_content(
                         source=source,
                         text=caption,
                         author=username,
                         url=post_url
-                    )
-                    posts_data.append(content_data)
-                    count += 1
+                    ))
                     
                 except Exception as e:
                     logger.warning(f"Error processing post: {e}")
                     continue
+            
+            # One timestamp for the whole scrape pass
+            now = datetime.utcnow()
+            posts_data = self._save_contents(contents, scraped_at=now)
 
             # Update source last scraped time
-            source.last_scraped_at = datetime.utcnow()
+            source.last_scraped_at = now
             
             # Commit all changes
             db.session.commit()
@@ -226,13 +248,12 @@ class InstagramScraperDB:
             )
 
             # Scrape hashtag posts
-            posts_data = []
-            count = 0
+            contents = []
             
             hashtag_obj = instaloader.Hashtag.from_name(self.loader.context, hashtag)
             
             for post in hashtag_obj.get_posts():
-                if count >= max_posts:
+                if len(contents) >= max_posts:
                     break
                     
                 try:
@@ -240,22 +261,24 @@ class InstagramScraperDB:
                     author = post.owner_username
                     post_url = f"https://www.instagram.com/p/{post.shortcode}/"
                     
-                    # Save content and get analysis
-                    content_data = self._analyze_and_save_content(
+                    # Analyze the post; rows are saved together below
+                    contents.append(self._build_content(
                         source=source,
                         text=caption,
                         author=author,
                         url=post_url
-                    )
-                    posts_data.append(content_data)
-                    count += 1
+                    ))
                     
                 except Exception as e:
                     logger.warning(f"Error processing hashtag post: {e}")
                     continue
+            
+            # One timestamp for the whole scrape pass
+            now = datetime.utcnow()
+            posts_data = self._save_contents(contents, scraped_at=now)
 
             # Update source last scraped time
-            source.last_scraped_at = datetime.utcnow()
+            source.last_scraped_at = now
             
             # Commit all changes
             db.session.commit()
@@ -1,10 +1,22 @@
 import re
 import logging
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Dict, List, Tuple
 from collections import Counter
 
 logger = logging.getLogger(__name__)
 
+# Risk score bands: [0, 15) low, [15, 30) medium, [30, 50) high, 50+ critical
+RISK_SCORE_THRESHOLDS = (15, 30, 50)
+RISK_LEVEL_NAMES = ('low', 'medium', 'high', 'critical')
+
+
+def risk_band(risk_score: int) -> int:
+    """Index of the risk band a score falls in (0 = low ... 3 = critical)"""
+    return bisect_right(RISK_SCORE_THRESHOLDS, risk_score)
+
+
 class KeywordDetector:
     """Keyword detection and content analysis service"""
     
@@ -54,6 +66,10 @@ class KeywordDetector:
         for category, keywords in self.keyword_categories.items():
             pattern = '|'.join(map(re.escape, keywords))
             self.patterns[category] = re.compile(pattern, re.IGNORECASE)
+        
+        # Bumped whenever the keyword set changes, so callers that memoize
+        # analysis results can tell when they are stale
+        self.keywords_version = 0
     
     def analyze_content(self, text: str) -> Dict:
         """
@@ -67,55 +83,112 @@ class KeywordDetector:
         """
         try:
             if not text:
-                return {
-                    'risk_level': 'low',
-                    'keywords': [],
-                    'categories_found': [],
-                    'risk_score': 0,
-                    'analysis': 'No content to analyze'
-                }
+                return self._empty_result()
             
             # Find keywords in each category
-            found_keywords = {}
-            category_matches = {}
+            matches_by_category = {}
             
             for category, pattern in self.patterns.items():
                 matches = pattern.findall(text.lower())
                 if matches:
-                    found_keywords[category] = list(set(matches))
-                    category_matches[category] = len(matches)
-            
-            # Calculate risk score
-            risk_score = self._calculate_risk_score(category_matches)
-            risk_level = self._determine_risk_level(risk_score)
+                    matches_by_category[category] = matches
             
-            # Get all unique keywords found
-            all_keywords = []
-            for keywords in found_keywords.values():
-                all_keywords.extend(keywords)
+            analysis_result = self._build_result(matches_by_category)
             
-            analysis_result = {
-                'risk_level': risk_level,
-                'risk_score': risk_score,
-                'keywords': list(set(all_keywords)),
-                'categories_found': list(found_keywords.keys()),
-                'category_details': found_keywords,
-                'match_counts': category_matches,
-                'analysis': self._generate_analysis_summary(found_keywords, risk_level)
-            }
-            
-            logger.info(f"Content analysis completed. Risk level: {risk_level}, Score: {risk_score}")
+            logger.info(f"Content analysis completed. Risk level: {analysis_result['risk_level']}, "
+                        f"Score: {analysis_result['risk_score']}")
             return analysis_result
             
         except Exception as e:
             logger.error(f"Error analyzing content: {e}")
-            return {
-                'risk_level': 'unknown',
-                'keywords': [],
-                'categories_found': [],
-                'risk_score': 0,
-                'analysis': f'Error during analysis: {str(e)}'
-            }
+            return self._error_result(e)
+    
+    def analyze_many(self, texts: List[str]) -> List[Dict]:
+        """
+        Analyze several texts with one regex scan per category
+        
+        Args:
+            texts: Text contents to analyze
+            
+        Returns:
+            List of analysis results, in the same order as ``texts``
+        """
+        try:
+            lowered = [text.lower() if text else '' for text in texts]
+            
+            # Keywords never contain the separator, so no match spans two texts
+            joined = '\x1f'.join(lowered)
+            starts = []
+            offset = 0
+            for text in lowered:
+                starts.append(offset)
+                offset += len(text) + 1
+            
+            per_text = [{} for _ in texts]
+            for category, pattern in self.patterns.items():
+                for match in pattern.finditer(joined):
+                    index = bisect_right(starts, match.start()) - 1
+                    per_text[index].setdefault(category, []).append(match.group())
+            
+            results = [
+                self._build_result(matches) if text else self._empty_result()
+                for text, matches in zip(texts, per_text)
+            ]
+            
+            logger.info(f"Batch content analysis completed for {len(texts)} texts")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error analyzing content batch: {e}")
+            return [self._error_result(e) for _ in texts]
+    
+    def _build_result(self, matches_by_category: Dict[str, List[str]]) -> Dict:
+        """Build an analysis result from the raw keyword matches of one text"""
+        found_keywords = {}
+        category_matches = {}
+        
+        for category, matches in matches_by_category.items():
+            found_keywords[category] = list(set(matches))
+            category_matches[category] = len(matches)
+        
+        # Calculate risk score
+        risk_score = self._calculate_risk_score(category_matches)
+        risk_level = self._determine_risk_level(risk_score)
+        
+        # Get all unique keywords found
+        all_keywords = []
+        for keywords in found_keywords.values():
+            all_keywords.extend(keywords)
+        
+        return {
+            'risk_level': risk_level,
+            'risk_score': risk_score,
+            'keywords': list(set(all_keywords)),
+            'categories_found': list(found_keywords.keys()),
+            'category_details': found_keywords,
+            'match_counts': category_matches,
+            'analysis': self._generate_analysis_summary(found_keywords, risk_level)
+        }
+    
+    def _empty_result(self) -> Dict:
+        """Analysis result for empty content"""
+        return {
+            'risk_level': 'low',
+            'keywords': [],
+            'categories_found': [],
+            'risk_score': 0,
+            'analysis': 'No content to analyze'
+        }
+    
+    def _error_result(self, error: Exception) -> Dict:
+        """Analysis result when analysis fails"""
+        return {
+            'risk_level': 'unknown',
+            'keywords': [],
+            'categories_found': [],
+            'risk_score': 0,
+            'analysis': f'Error during analysis: {str(error)}'
+        }
     
     def _calculate_risk_score(self, category_matches: Dict) -> int:
         """Calculate risk score based on keyword matches"""
@@ -131,14 +204,7 @@ class KeywordDetector:
     
     def _determine_risk_level(self, risk_score: int) -> str:
         """Determine risk level based on score"""
-        if risk_score >= 50:
-            return 'critical'
-        elif risk_score >= 30:
-            return 'high'
-        elif risk_score >= 15:
-            return 'medium'
-        else:
-            return 'low'
+        return RISK_LEVEL_NAMES[risk_band(risk_score)]
     
     def _generate_analysis_summary(self, found_keywords: Dict, risk_level: str) -> str:
         """Generate human-readable analysis summary"""
@@ -165,6 +231,7 @@ class KeywordDetector:
         # Recompile pattern for this category
         pattern = '|'.join(map(re.escape, self.keyword_categories[category]))
         self.patterns[category] = re.compile(pattern, re.IGNORECASE)
+        self.keywords_version += 1
         
         logger.info(f"Added {len(keywords)} custom keywords to category '{category}'")
     
@@ -185,6 +252,7 @@ class KeywordDetector:
                 del self.risk_weights[category]
                 if category in self.patterns:
                     del self.patterns[category]
+            self.keywords_version += 1
         
         logger.info(f"Removed {len(keywords)} keywords from category '{category}'")
     
@@ -220,4 +288,15 @@ class KeywordDetector:
             'not_found': not_found,
             'total_found': len(found),
             'total_searched': len(keywords)
-        } 
\ No newline at end of file
+        } 
+
+
+@lru_cache(maxsize=1)
+def get_keyword_detector() -> KeywordDetector:
+    """
+    Get the shared KeywordDetector instance
+    
+    The category patterns are compiled once per process. Custom keywords
+    added to the shared instance are visible to every caller.
+    """
+    return KeywordDetector()
@@ -1,5 +1,6 @@
 import logging
 import json
+import re
 from datetime import datetime
 from typing import Dict, List, Optional
 import threading
@@ -8,6 +9,9 @@ from .osint_tools import OSINTToolsService
 
 logger = logging.getLogger(__name__)
 
+# URL embedded in a SpiderFoot finding's data field
+_FINDING_URL_RE = re.compile(r'https?://[^\s]+')
+
 class OSINTHandler:
     """Enhanced OSINT handler using real tools"""
     
@@ -508,8 +512,7 @@ class OSINTHandler:
                         data = finding.get('data', '')
                         if 'http' in data:
                             # Try to extract URL from the finding data
-                            import re
-                            url_match = re.search(r'https?://[^\s]+', data)
+                            url_match = _FINDING_URL_RE.search(data)
                             if url_match:
                                 url = url_match.group()
                                 platform = self._extract_platform_from_url(url)
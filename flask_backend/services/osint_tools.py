@@ -4,6 +4,7 @@ import os
 import tempfile
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from pathlib import Path
 from datetime import datetime
@@ -12,6 +13,11 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent profile-URL checks in the username fallbacks.
+# Each host gets a single request, so this is what bounds the burst of
+# outgoing requests per lookup.
+PLATFORM_CHECK_WORKERS = 10
+
 class OSINTToolsService:
     """Service for running real OSINT tools like Sherlock and Spiderfoot"""
     
@@ -798,22 +804,28 @@ class OSINTToolsService:
             'Telegram': f'https://t.me/{username}'
         }
         
-        # Check each platform
-        for platform, url in platforms.items():
+        # Check each platform concurrently - every URL is on a different host
+        def check_platform(item):
+            platform, url = item
             try:
-                if self.check_url_exists(url):
-                    profiles.append({
-                        'platform': platform,
-                        'url': url,
-                        'status': 'found',
-                        'verified': True,
-                        'source': 'url_check'
-                    })
-                    logger.info(f"Found profile: {platform} - {url}")
-                time.sleep(0.1)  # Faster rate limiting
+                return self.check_url_exists(url)
             except Exception as e:
                 logger.debug(f"Error checking {platform}: {e}")
-                continue
+                return False
+        
+        with ThreadPoolExecutor(max_workers=min(PLATFORM_CHECK_WORKERS, len(platforms))) as executor:
+            found = list(executor.map(check_platform, platforms.items()))
+        
+        for (platform, url), exists in zip(platforms.items(), found):
+            if exists:
+                profiles.append({
+                    'platform': platform,
+                    'url': url,
+                    'status': 'found',
+                    'verified': True,
+                    'source': 'url_check'
+                })
+                logger.info(f"Found profile: {platform} - {url}")
         
         # Try GitHub API for more detailed info
         try:
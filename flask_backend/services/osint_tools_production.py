@@ -5,9 +5,12 @@ Works without requiring Spiderfoot web UI or subprocess calls
 import logging
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from pathlib import Path
 
+from .osint_tools import PLATFORM_CHECK_WORKERS
+
 logger = logging.getLogger(__name__)
 
 class ProductionOSINTService:
@@ -125,28 +128,32 @@ class ProductionOSINTService:
         
         profiles = []
         
-        for platform, url in platforms.items():
+        def check_platform(item):
+            platform, url = item
             try:
                 # Quick HEAD request to check if URL exists
                 response = requests.head(url, timeout=3, allow_redirects=True, headers={
                     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
                 })
-                
-                if response.status_code in [200, 301, 302]:
-                    profiles.append({
-                        'platform': platform,
-                        'url': url,
-                        'status': 'found',
-                        'source': 'url_check',
-                        'verified': True
-                    })
-                    logger.info(f"Found: {platform} - {url}")
-                    
+                return response.status_code in [200, 301, 302]
             except Exception as e:
                 logger.debug(f"Platform {platform} check failed: {e}")
-                continue
-            
-            time.sleep(0.1)  # Rate limiting
+                return False
+        
+        # Every URL is on a different host, so check them concurrently
+        with ThreadPoolExecutor(max_workers=min(PLATFORM_CHECK_WORKERS, len(platforms))) as executor:
+            found = list(executor.map(check_platform, platforms.items()))
+        
+        for (platform, url), exists in zip(platforms.items(), found):
+            if exists:
+                profiles.append({
+                    'platform': platform,
+                    'url': url,
+                    'status': 'found',
+                    'source': 'url_check',
+                    'verified': True
+                })
+                logger.info(f"Found: {platform} - {url}")
         
         return profiles
     
@@ -6,6 +6,7 @@ import asyncio
 import os
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 import logging
 from dotenv import load_dotenv
@@ -17,6 +18,23 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+TELEGRAM_ENV_KEYS = (
+    'TELEGRAM_API_ID',
+    'TELEGRAM_API_HASH',
+    'TELEGRAM_BOT_TOKEN',
+    'TELEGRAM_PHONE_NUMBER',
+)
+
+@lru_cache(maxsize=1)
+def get_telegram_credentials() -> Dict[str, Optional[str]]:
+    """
+    Snapshot of the Telegram credentials from the environment
+
+    Read once per process; call get_telegram_credentials.cache_clear()
+    to pick up changed environment variables.
+    """
+    return {key: os.environ.get(key) for key in TELEGRAM_ENV_KEYS}
+
 class TelegramScraper:
     """
     Telegram scraper for public channels and groups
@@ -24,15 +42,21 @@ class TelegramScraper:
     """
     
     def __init__(self):
-        self.api_id = os.environ.get('TELEGRAM_API_ID')
-        self.api_hash = os.environ.get('TELEGRAM_API_HASH')
-        self.bot_token = os.environ.get('TELEGRAM_BOT_TOKEN')
+        creds = get_telegram_credentials()
+        self.api_id = creds['TELEGRAM_API_ID']
+        self.api_hash = creds['TELEGRAM_API_HASH']
+        self.bot_token = creds['TELEGRAM_BOT_TOKEN']
+        self.phone_number = creds['TELEGRAM_PHONE_NUMBER']
         self.session_file = 'telegram_session'
         self.client = None
         
     async def initialize(self):
         """Initialize Telegram client"""
         try:
+            # Fast path: an already connected, authorized client is reused as-is
+            if self.client and self.client.is_connected() and await self.client.is_user_authorized():
+                return True
+            
             # Try to import telethon (popular Telegram client library)
             import sys
             if sys.version_info >= (3, 13):
@@ -59,18 +83,23 @@ class TelegramScraper:
                 system_version="4.16.30-vxCUSTOM"
             )
             
-            # Start the client - prioritize user authentication for channel access
-            phone_number = os.environ.get('TELEGRAM_PHONE_NUMBER')
-            if phone_number:
-                # Use phone number authentication (required for channel access)
-                # Don't pass bot_token when using phone authentication
-                await self.client.start(phone=phone_number)
-            elif self.bot_token:
-                # Use bot token authentication (limited channel access)
-                await self.client.start(bot_token=self.bot_token)
-            else:
-                # Try to start without authentication (for existing sessions)
-                await self.client.start()
+            # Connect with the persisted session first; the full start() sign-in
+            # flow is only needed when that session is not authorized yet
+            await self.client.connect()
+            
+            if not await self.client.is_user_authorized():
+                # Start the client - prioritize user authentication for channel access
+                phone_number = self.phone_number
+                if phone_number:
+                    # Use phone number authentication (required for channel access)
+                    # Don't pass bot_token when using phone authentication
+                    await self.client.start(phone=phone_number)
+                elif self.bot_token:
+                    # Use bot token authentication (limited channel access)
+                    await self.client.start(bot_token=self.bot_token)
+                else:
+                    # Try to start without authentication (for existing sessions)
+                    await self.client.start()
             
             # Check if we're connected
             if await self.client.is_user_authorized():
@@ -35,17 +35,17 @@ with app.app_context():
         try:
             # Execute raw SQL to get all data
             result = db.session.execute(db.text(f"SELECT * FROM {table_name}"))
-            columns = result.keys()
+            columns = list(result.keys())
             rows = result.fetchall()
             
-            # Convert to list of dicts
-            all_data[table_name] = [dict(zip(columns, row)) for row in rows]
-            print(f"   ✅ {table_name}: {len(all_data[table_name])} records")
+            # Keep rows as positional tuples; they are inserted as-is
+            all_data[table_name] = (columns, rows)
+            print(f"   ✅ {table_name}: {len(rows)} records")
         except Exception as e:
-            all_data[table_name] = []
+            all_data[table_name] = ([], [])
             print(f"   ⚠️  {table_name}: Error - {str(e)[:50]}")
     
-    total = sum(len(v) for v in all_data.values())
+    total = sum(len(rows) for _, rows in all_data.values())
     print(f"\n📊 Total: {total} records exported")
 
 # Import to local SQLite
@@ -60,30 +60,43 @@ cursor = conn.cursor()
 print(f"✅ Connected: {db_path}\n")
 
 # Import each table
-for table_name, records in all_data.items():
-    if not records:
+for table_name, (columns, rows) in all_data.items():
+    if not rows:
         print(f"   ⏭️  {table_name}: No data to import")
         continue
     
     imported = 0
     skipped = 0
     
-    for record in records:
-        try:
-            # Convert datetime objects to ISO strings
-            for key, value in record.items():
-                if hasattr(value, 'isoformat'):
-                    record[key] = value.isoformat()
-            
-            # Build INSERT OR REPLACE statement
-            columns = list(record.keys())
-            placeholders = ','.join(['?' for _ in columns])
-            sql = f"INSERT OR REPLACE INTO {table_name} ({','.join(columns)}) VALUES ({placeholders})"
-            
-            cursor.execute(sql, tuple(record[col] for col in columns))
-            imported += 1
-        except Exception as e:
-            skipped += 1
+    # Every row of a table shares the same columns, so build the
+    # INSERT OR REPLACE statement once per table
+    placeholders = ','.join(['?' for _ in columns])
+    sql = f"INSERT OR REPLACE INTO {table_name} ({','.join(columns)}) VALUES ({placeholders})"
+    
+    # Find the datetime columns once; only those need converting to ISO strings
+    dt_idx = [
+        i for i in range(len(columns))
+        if any(hasattr(row[i], 'isoformat') for row in rows)
+    ]
+    params = []
+    for row in rows:
+        row = list(row)
+        for i in dt_idx:
+            row[i] = row[i].isoformat() if row[i] else None
+        params.append(row)
+    
+    try:
+        cursor.executemany(sql, params)
+        imported = len(params)
+    except Exception:
+        # Fall back to row-by-row so one bad record doesn't drop the table
+        conn.rollback()
+        for row in params:
+            try:
+                cursor.execute(sql, row)
+                imported += 1
+            except Exception as e:
+                skipped += 1
     
     conn.commit()
     status = f"{imported} imported"
@@ -97,9 +110,9 @@ print("\n" + "=" * 80)
 print("✅ SYNC COMPLETE!")
 print("=" * 80)
 print(f"\n📊 Summary:")
-for table_name, records in all_data.items():
-    if records:
-        print(f"   • {table_name}: {len(records)}")
+for table_name, (_, rows) in all_data.items():
+    if rows:
+        print(f"   • {table_name}: {len(rows)}")
 print(f"\n   TOTAL: {total} records")
 print(f"\n💾 Local: {db_path}")
 print(f"🌐 Railway: Unchanged\n")
@@ -1,28 +1,35 @@
 """
 Test script to verify content analysis endpoint is working
 """
+import atexit
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# Shared keep-alive session so consecutive calls reuse one connection
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=0))
+atexit.register(_session.close)
+
+_ANALYZE_URL = "http://127.0.0.1:5000/api/content-analysis/analyze"
+
+# Test data
+_TEST_DATA = {
+    "platform": "Instagram",
+    "username": "test_user",
+    "content": "This is a test content for analysis",
+    "save_to_database": True
+}
+
+_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": "Bearer test_token"  # You'll need a real token
+}
 
 def test_content_analysis():
     """Test the content analysis endpoint"""
-    url = "http://127.0.0.1:5000/api/content-analysis/analyze"
-    
-    # Test data
-    data = {
-        "platform": "Instagram",
-        "username": "test_user",
-        "content": "This is a test content for analysis",
-        "save_to_database": True
-    }
-    
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": "Bearer test_token"  # You'll need a real token
-    }
-    
     try:
-        response = requests.post(url, json=data, headers=headers)
+        response = _session.post(_ANALYZE_URL, json=_TEST_DATA, headers=_HEADERS)
         print(f"Status Code: {response.status_code}")
         print(f"Response: {response.text}")
         
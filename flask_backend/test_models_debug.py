@@ -1,135 +1,102 @@
 """
 Debug script to test database models and identify potential issues
 """
+import importlib
 import sys
 import os
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# (module, model names) checked by test_model_imports
+MODEL_IMPORTS = [
+    ('models.case', ('Case',)),
+    ('models.user', ('SystemUser', 'User')),
+    ('models.active_case', ('ActiveCase',)),
+    ('models.content', ('Content',)),
+    ('models.osint_result', ('OSINTResult',)),
+    ('models.case_content_link', ('CaseContentLink',)),
+    ('models.user_case_link', ('UserCaseLink',)),
+]
+
+# (table, model) pairs counted by test_database_connection
+MODEL_TABLES = [
+    ('cases', 'Case'),
+    ('system_users', 'SystemUser'),
+    ('active_cases', 'ActiveCase'),
+    ('content', 'Content'),
+    ('osint_results', 'OSINTResult'),
+]
+
 def test_model_imports():
     """Test if all required models can be imported"""
     print("Testing model imports...")
     print("=" * 30)
     
-    try:
-        from models.case import Case
-        print("✅ Case model imported successfully")
-    except Exception as e:
-        print(f"❌ Case model import failed: {str(e)}")
-        return False
-    
-    try:
-        from models.user import SystemUser, User
-        print("✅ User models imported successfully")
-    except Exception as e:
-        print(f"❌ User models import failed: {str(e)}")
-        return False
-    
-    try:
-        from models.active_case import ActiveCase
-        print("✅ ActiveCase model imported successfully")
-    except Exception as e:
-        print(f"❌ ActiveCase model import failed: {str(e)}")
-        return False
-    
-    try:
-        from models.content import Content
-        print("✅ Content model imported successfully")
-    except Exception as e:
-        print(f"❌ Content model import failed: {str(e)}")
-        return False
-    
-    try:
-        from models.osint_result import OSINTResult
-        print("✅ OSINTResult model imported successfully")
-    except Exception as e:
-        print(f"❌ OSINTResult model import failed: {str(e)}")
-        return False
-    
-    try:
-        from models.case_content_link import CaseContentLink
-        print("✅ CaseContentLink model imported successfully")
-    except Exception as e:
-        print(f"❌ CaseContentLink model import failed: {str(e)}")
-        return False
+    failures = []
+    for module_name, model_names in MODEL_IMPORTS:
+        label = ', '.join(model_names)
+        try:
+            module = importlib.import_module(module_name)
+            for model_name in model_names:
+                getattr(module, model_name)
+            print(f"✅ {label} imported successfully")
+        except Exception as e:
+            print(f"❌ {label} import failed: {str(e)}")
+            failures.append(module_name)
     
+    return not failures
+
+def create_debug_app():
+    """Create the Flask app for the database checks, or None if that fails"""
     try:
-        from models.user_case_link import UserCaseLink
-        print("✅ UserCaseLink model imported successfully")
+        from app import create_app
+        return create_app()
     except Exception as e:
-        print(f"❌ UserCaseLink model import failed: {str(e)}")
-        return False
-    
-    return True
+        print(f"❌ App creation failed: {str(e)}")
+        return None
 
 def test_database_connection():
-    """Test database connection and basic queries"""
+    """Test database connection and basic queries (inside an app context)"""
     print("\nTesting database connection...")
     print("=" * 35)
     
     try:
-        from app import app
         from extensions import db
+        from sqlalchemy import text
+        
+        # Test basic database connection
+        with db.engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
+        print("✅ Database connection successful")
+        
+        # Count every model's table in one round-trip; a missing or
+        # unreadable table fails the whole statement
+        try:
+            counts = db.session.execute(text(
+                "SELECT " + ", ".join(
+                    f"(SELECT COUNT(*) FROM {table})" for table, _ in MODEL_TABLES
+                )
+            )).one()
+        except Exception as e:
+            print(f"❌ Model table query failed: {str(e)}")
+            return False
+        
+        for (_, label), count in zip(MODEL_TABLES, counts):
+            print(f"✅ {label} table query successful ({count} rows)")
+        
+        return True
         
-        with app.app_context():
-            # Test basic database connection
-            result = db.session.execute("SELECT 1").fetchone()
-            print("✅ Database connection successful")
-            
-            # Test Case model query
-            try:
-                cases = db.session.query(Case).limit(1).all()
-                print(f"✅ Case model query successful (found {len(cases)} cases)")
-            except Exception as e:
-                print(f"❌ Case model query failed: {str(e)}")
-                return False
-            
-            # Test SystemUser model query
-            try:
-                users = db.session.query(SystemUser).limit(1).all()
-                print(f"✅ SystemUser model query successful (found {len(users)} users)")
-            except Exception as e:
-                print(f"❌ SystemUser model query failed: {str(e)}")
-                return False
-            
-            # Test ActiveCase model query
-            try:
-                active_cases = db.session.query(ActiveCase).limit(1).all()
-                print(f"✅ ActiveCase model query successful (found {len(active_cases)} active cases)")
-            except Exception as e:
-                print(f"❌ ActiveCase model query failed: {str(e)}")
-                return False
-            
-            # Test Content model query
-            try:
-                content = db.session.query(Content).limit(1).all()
-                print(f"✅ Content model query successful (found {len(content)} content items)")
-            except Exception as e:
-                print(f"❌ Content model query failed: {str(e)}")
-                return False
-            
-            # Test OSINTResult model query
-            try:
-                osint_results = db.session.query(OSINTResult).limit(1).all()
-                print(f"✅ OSINTResult model query successful (found {len(osint_results)} OSINT results)")
-            except Exception as e:
-                print(f"❌ OSINTResult model query failed: {str(e)}")
-                return False
-            
-            return True
-            
     except Exception as e:
         print(f"❌ Database connection failed: {str(e)}")
         return False
 
 def test_preview_logic():
-    """Test the preview logic without the Flask context"""
+    """Test the preview logic step by step (inside an app context)"""
     print("\nTesting preview logic...")
     print("=" * 25)
     
     try:
-        from app import app
         from extensions import db
         from models.case import Case
         from models.user import SystemUser
@@ -138,73 +105,69 @@ def test_preview_logic():
         from models.osint_result import OSINTResult
         from models.case_content_link import CaseContentLink
         
-        with app.app_context():
-            # Test the preview logic step by step
-            print("1. Testing user query...")
-            users = db.session.query(SystemUser).limit(1).all()
-            if not users:
-                print("❌ No users found in database")
+        # Test the preview logic step by step
+        print("1. Testing user query...")
+        users = db.session.query(SystemUser).limit(1).all()
+        if not users:
+            print("❌ No users found in database")
+            return False
+        print(f"✅ Found {len(users)} users")
+        
+        print("2. Testing active case query...")
+        # The active case and its case row come back from one joined query
+        active_case_row = db.session.query(ActiveCase, Case).outerjoin(
+            Case, Case.id == ActiveCase.case_id
+        ).first()
+        print(f"✅ Found {1 if active_case_row else 0} active cases")
+        
+        if active_case_row:
+            active, case = active_case_row
+            case_id = active.case_id
+            print(f"3. Checking case for ID {case_id}...")
+            
+            if not case:
+                print(f"❌ Case with ID {case_id} not found")
                 return False
-            print(f"✅ Found {len(users)} users")
+            print(f"✅ Found case: {case.title}")
             
-            print("2. Testing active case query...")
-            active_cases = db.session.query(ActiveCase).limit(1).all()
-            print(f"✅ Found {len(active_cases)} active cases")
+            print("4. Testing linked content query...")
+            # Content is joined through its case links instead of
+            # loading the links and then the content by ID
+            content_items = db.session.query(Content).join(
+                CaseContentLink, CaseContentLink.content_id == Content.id
+            ).filter(CaseContentLink.case_id == case_id).all()
+            print(f"✅ Found {len(content_items)} content items")
             
-            if active_cases:
-                active = active_cases[0]
-                case_id = active.case_id
-                print(f"3. Testing case query for ID {case_id}...")
-                
-                case = db.session.query(Case).get(case_id)
-                if not case:
-                    print(f"❌ Case with ID {case_id} not found")
-                    return False
-                print(f"✅ Found case: {case.title}")
-                
-                print("4. Testing content links query...")
-                content_links = db.session.query(CaseContentLink).filter_by(case_id=case_id).all()
-                print(f"✅ Found {len(content_links)} content links")
-                
-                print("5. Testing content query...")
-                if content_links:
-                    content_ids = [link.content_id for link in content_links]
-                    content_items = db.session.query(Content).filter(Content.id.in_(content_ids)).all()
-                    print(f"✅ Found {len(content_items)} content items")
-                else:
-                    content_items = []
-                    print("✅ No content items (empty list)")
-                
-                print("6. Testing OSINT results query...")
-                osint_results = db.session.query(OSINTResult).filter_by(case_id=case_id).all()
-                print(f"✅ Found {len(osint_results)} OSINT results")
-                
-                print("7. Testing preview data creation...")
-                preview_data = {
-                    'case': {
-                        'id': case.id,
-                        'title': case.title,
-                        'case_number': case.case_number,
-                        'status': case.status.value if case.status else None,
-                        'priority': case.priority.value if case.priority else None,
-                        'created_at': case.created_at.isoformat(),
-                        'updated_at': case.updated_at.isoformat()
-                    },
-                    'statistics': {
-                        'platforms_analyzed': 'None',
-                        'flagged_users': 0,
-                        'flagged_posts': len(content_items),
-                        'osint_results': len(osint_results)
-                    }
+            print("5. Testing OSINT results query...")
+            osint_results = db.session.query(OSINTResult).filter_by(case_id=case_id).all()
+            print(f"✅ Found {len(osint_results)} OSINT results")
+            
+            print("6. Testing preview data creation...")
+            preview_data = {
+                'case': {
+                    'id': case.id,
+                    'title': case.title,
+                    'case_number': case.case_number,
+                    'status': case.status.value if case.status else None,
+                    'priority': case.priority.value if case.priority else None,
+                    'created_at': case.created_at.isoformat(),
+                    'updated_at': case.updated_at.isoformat()
+                },
+                'statistics': {
+                    'platforms_analyzed': 'None',
+                    'flagged_users': 0,
+                    'flagged_posts': len(content_items),
+                    'osint_results': len(osint_results)
                 }
-                print("✅ Preview data created successfully")
-                print(f"Preview data: {preview_data}")
-                
-                return True
-            else:
-                print("✅ No active cases found (this is normal)")
-                return True
-                
+            }
+            print("✅ Preview data created successfully")
+            print(f"Preview data: {preview_data}")
+            
+            return True
+        else:
+            print("✅ No active cases found (this is normal)")
+            return True
+            
     except Exception as e:
         print(f"❌ Preview logic test failed: {str(e)}")
         import traceback
@@ -219,13 +182,21 @@ if __name__ == "__main__":
     imports_ok = test_model_imports()
     
     if imports_ok:
-        # Test database connection
-        db_ok = test_database_connection()
+        app = create_debug_app()
+        db_ok = False
+        preview_ok = False
+        
+        if app is not None:
+            # Both database checks run in one app context and session
+            with app.app_context():
+                # Test database connection
+                db_ok = test_database_connection()
+                
+                if db_ok:
+                    # Test preview logic
+                    preview_ok = test_preview_logic()
         
         if db_ok:
-            # Test preview logic
-            preview_ok = test_preview_logic()
-            
             print("\n" + "=" * 50)
             print("SUMMARY:")
             print(f"Model Imports: {'✅ SUCCESS' if imports_ok else '❌ FAILED'}")
@@ -1,8 +1,21 @@
 """
 Test script to verify the Narcotics Intelligence Platform report format
 """
+import atexit
+import os
+import shutil
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# One keep-alive connection pool for every endpoint hit in this script
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+atexit.register(_session.close)
+
+PDF_OUTPUT_PATH = 'test_narcotics_report.pdf'
+# PDFs are streamed in chunks of this size instead of buffered whole
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 def test_narcotics_report_generation():
     """Test the Narcotics Intelligence Platform report generation"""
@@ -16,31 +29,32 @@ def test_narcotics_report_generation():
         url = f"http://127.0.0.1:5000/api/reports/{case_id}/generate-detailed"
         print(f"Testing URL: {url}")
         
-        response = requests.get(url, timeout=30)
-        print(f"Response Status: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('content-type')}")
-        print(f"Content-Length: {response.headers.get('content-length')}")
-        
-        if response.status_code == 200:
-            content_type = response.headers.get('content-type', '')
-            if 'application/pdf' in content_type:
-                print("✅ Narcotics Intelligence Platform report generated successfully!")
-                print(f"PDF size: {len(response.content)} bytes")
-                
-                # Save the PDF for inspection
-                with open('test_narcotics_report.pdf', 'wb') as f:
-                    f.write(response.content)
-                print("✅ PDF saved as 'test_narcotics_report.pdf' for inspection")
-                
-                return True
+        with _session.get(url, timeout=30, stream=True) as response:
+            print(f"Response Status: {response.status_code}")
+            print(f"Content-Type: {response.headers.get('content-type')}")
+            print(f"Content-Length: {response.headers.get('content-length')}")
+            
+            if response.status_code == 200:
+                content_type = response.headers.get('content-type', '')
+                if 'application/pdf' in content_type:
+                    print("✅ Narcotics Intelligence Platform report generated successfully!")
+                    
+                    # Save the PDF for inspection, writing it as it arrives
+                    response.raw.decode_content = True
+                    with open(PDF_OUTPUT_PATH, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                    print(f"PDF size: {os.path.getsize(PDF_OUTPUT_PATH)} bytes")
+                    print(f"✅ PDF saved as '{PDF_OUTPUT_PATH}' for inspection")
+                    
+                    return True
+                else:
+                    print("❌ Response is not a PDF")
+                    print(f"Response content: {response.text[:200]}...")
+                    return False
             else:
-                print("❌ Response is not a PDF")
-                print(f"Response content: {response.text[:200]}...")
+                print(f"❌ Report generation failed with status {response.status_code}")
+                print(f"Error response: {response.text}")
                 return False
-        else:
-            print(f"❌ Report generation failed with status {response.status_code}")
-            print(f"Error response: {response.text}")
-            return False
             
     except requests.exceptions.ConnectionError:
         print("❌ Backend server is not running. Please start the Flask server first.")
@@ -61,22 +75,23 @@ def test_basic_report_generation():
         url = f"http://127.0.0.1:5000/api/reports/{case_id}/generate"
         print(f"Testing URL: {url}")
         
-        response = requests.get(url, timeout=30)
-        print(f"Response Status: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('content-type')}")
-        
-        if response.status_code == 200:
-            content_type = response.headers.get('content-type', '')
-            if 'application/pdf' in content_type:
-                print("✅ Basic report generated successfully!")
-                print(f"PDF size: {len(response.content)} bytes")
-                return True
+        with _session.get(url, timeout=30, stream=True) as response:
+            print(f"Response Status: {response.status_code}")
+            print(f"Content-Type: {response.headers.get('content-type')}")
+            
+            if response.status_code == 200:
+                content_type = response.headers.get('content-type', '')
+                if 'application/pdf' in content_type:
+                    print("✅ Basic report generated successfully!")
+                    pdf_size = sum(len(chunk) for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE))
+                    print(f"PDF size: {pdf_size} bytes")
+                    return True
+                else:
+                    print("❌ Response is not a PDF")
+                    return False
             else:
-                print("❌ Response is not a PDF")
+                print(f"❌ Basic report generation failed with status {response.status_code}")
                 return False
-        else:
-            print(f"❌ Basic report generation failed with status {response.status_code}")
-            return False
             
     except Exception as e:
         print(f"❌ Error testing basic report: {str(e)}")
@@ -1,8 +1,18 @@
 """
 Test script to verify PDF generation is working
 """
+import atexit
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# One keep-alive connection pool for every endpoint hit in this script
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+atexit.register(_session.close)
+
+# PDFs are streamed in chunks of this size instead of buffered whole
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 def test_pdf_generation():
     """Test the PDF generation endpoint"""
@@ -17,22 +27,23 @@ def test_pdf_generation():
     }
     
     try:
-        response = requests.get(url, headers=headers)
-        print(f"Status Code: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('content-type')}")
-        print(f"Content-Length: {response.headers.get('content-length')}")
-        
-        if response.status_code == 200:
-            content_type = response.headers.get('content-type', '')
-            if 'application/pdf' in content_type:
-                print("✅ PDF generation endpoint is working!")
-                print(f"PDF size: {len(response.content)} bytes")
+        with _session.get(url, headers=headers, stream=True) as response:
+            print(f"Status Code: {response.status_code}")
+            print(f"Content-Type: {response.headers.get('content-type')}")
+            print(f"Content-Length: {response.headers.get('content-length')}")
+            
+            if response.status_code == 200:
+                content_type = response.headers.get('content-type', '')
+                if 'application/pdf' in content_type:
+                    print("✅ PDF generation endpoint is working!")
+                    pdf_size = sum(len(chunk) for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE))
+                    print(f"PDF size: {pdf_size} bytes")
+                else:
+                    print("❌ Response is not a PDF")
+                    print(f"Response content: {response.text[:200]}...")
             else:
-                print("❌ Response is not a PDF")
-                print(f"Response content: {response.text[:200]}...")
-        else:
-            print("❌ PDF generation endpoint has issues")
-            print(f"Error response: {response.text}")
+                print("❌ PDF generation endpoint has issues")
+                print(f"Error response: {response.text}")
             
     except requests.exceptions.ConnectionError:
         print("❌ Backend server is not running. Please start the Flask server first.")
@@ -46,22 +57,23 @@ def test_detailed_pdf_generation():
     url = f"http://127.0.0.1:5000/api/reports/{case_id}/generate-detailed"
     
     try:
-        response = requests.get(url)
-        print(f"Status Code: {response.status_code}")
-        print(f"Content-Type: {response.headers.get('content-type')}")
-        print(f"Content-Length: {response.headers.get('content-length')}")
-        
-        if response.status_code == 200:
-            content_type = response.headers.get('content-type', '')
-            if 'application/pdf' in content_type:
-                print("✅ Detailed PDF generation endpoint is working!")
-                print(f"PDF size: {len(response.content)} bytes")
+        with _session.get(url, stream=True) as response:
+            print(f"Status Code: {response.status_code}")
+            print(f"Content-Type: {response.headers.get('content-type')}")
+            print(f"Content-Length: {response.headers.get('content-length')}")
+            
+            if response.status_code == 200:
+                content_type = response.headers.get('content-type', '')
+                if 'application/pdf' in content_type:
+                    print("✅ Detailed PDF generation endpoint is working!")
+                    pdf_size = sum(len(chunk) for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE))
+                    print(f"PDF size: {pdf_size} bytes")
+                else:
+                    print("❌ Response is not a PDF")
+                    print(f"Response content: {response.text[:200]}...")
             else:
-                print("❌ Response is not a PDF")
-                print(f"Response content: {response.text[:200]}...")
-        else:
-            print("❌ Detailed PDF generation endpoint has issues")
-            print(f"Error response: {response.text}")
+                print("❌ Detailed PDF generation endpoint has issues")
+                print(f"Error response: {response.text}")
             
     except requests.exceptions.ConnectionError:
         print("❌ Backend server is not running. Please start the Flask server first.")
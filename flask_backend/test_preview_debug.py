@@ -3,15 +3,53 @@ Debug script to test the preview endpoint and identify the 500 error
 """
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-def test_preview_endpoint():
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BASE_URL = "http://127.0.0.1:5000"
+
+# Independent probes fired together from __main__: name -> (path, timeout)
+PROBES = {
+    "health": ("/api/health", 5),
+    "reports_health": ("/api/reports/health", 5),
+    "preview": ("/api/reports/active/preview", 10),
+}
+
+def _dumps(data):
+    """Pretty-print JSON for the debug output, with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+def _loads(body):
+    """Parse a raw JSON response body, with orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+def prefetch_probes():
+    """Start every probe request at once and return their futures by name"""
+    with ThreadPoolExecutor(max_workers=len(PROBES)) as executor:
+        return {
+            name: executor.submit(requests.get, f"{BASE_URL}{path}", timeout=timeout)
+            for name, (path, timeout) in PROBES.items()
+        }
+
+def test_preview_endpoint(pending=None):
     """Test the preview endpoint to identify the 500 error"""
     print("Testing /api/reports/active/preview endpoint...")
     print("=" * 50)
     
     try:
         # Test without authentication first to see if it's an auth issue
-        response = requests.get("http://127.0.0.1:5000/api/reports/active/preview", timeout=10)
+        if pending is not None:
+            response = pending.result()
+        else:
+            response = requests.get(f"{BASE_URL}/api/reports/active/preview", timeout=10)
         print(f"Response Status: {response.status_code}")
         print(f"Response Headers: {dict(response.headers)}")
         
@@ -21,19 +59,21 @@ def test_preview_endpoint():
             return True
         elif response.status_code == 500:
             print("❌ Internal Server Error - checking response body...")
+            body = response.content
             try:
-                error_data = response.json()
-                print(f"Error Response: {json.dumps(error_data, indent=2)}")
-            except:
-                print(f"Error Response (text): {response.text}")
+                error_data = _loads(body)
+                print(f"Error Response: {_dumps(error_data)}")
+            except ValueError:
+                print(f"Error Response (text): {body.decode('utf-8', 'replace')}")
             return False
         elif response.status_code == 200:
             print("✅ Endpoint working without authentication")
+            body = response.content
             try:
-                data = response.json()
-                print(f"Response Data: {json.dumps(data, indent=2)}")
-            except:
-                print(f"Response Text: {response.text}")
+                data = _loads(body)
+                print(f"Response Data: {_dumps(data)}")
+            except ValueError:
+                print(f"Response Text: {body.decode('utf-8', 'replace')}")
             return True
         else:
             print(f"❌ Unexpected status code: {response.status_code}")
@@ -48,13 +88,16 @@ def test_preview_endpoint():
         print(f"❌ Error testing endpoint: {str(e)}")
         return False
 
-def test_health_endpoint():
+def test_health_endpoint(pending=None):
     """Test if the backend is running"""
     print("\nTesting backend health...")
     print("=" * 30)
     
     try:
-        response = requests.get("http://127.0.0.1:5000/api/health", timeout=5)
+        if pending is not None:
+            response = pending.result()
+        else:
+            response = requests.get(f"{BASE_URL}/api/health", timeout=5)
         print(f"Health Status: {response.status_code}")
         if response.status_code == 200:
             print("✅ Backend is running")
@@ -69,21 +112,25 @@ def test_health_endpoint():
         print(f"❌ Health check error: {str(e)}")
         return False
 
-def test_reports_health():
+def test_reports_health(pending=None):
     """Test the reports health endpoint"""
     print("\nTesting reports health...")
     print("=" * 30)
     
     try:
-        response = requests.get("http://127.0.0.1:5000/api/reports/health", timeout=5)
+        if pending is not None:
+            response = pending.result()
+        else:
+            response = requests.get(f"{BASE_URL}/api/reports/health", timeout=5)
         print(f"Reports Health Status: {response.status_code}")
         if response.status_code == 200:
             print("✅ Reports service is healthy")
+            body = response.content
             try:
-                data = response.json()
-                print(f"Reports Health Data: {json.dumps(data, indent=2)}")
-            except:
-                print(f"Reports Health Text: {response.text}")
+                data = _loads(body)
+                print(f"Reports Health Data: {_dumps(data)}")
+            except ValueError:
+                print(f"Reports Health Text: {body.decode('utf-8', 'replace')}")
             return True
         else:
             print(f"❌ Reports health check failed: {response.status_code}")
@@ -97,15 +144,19 @@ if __name__ == "__main__":
     print("Debugging Preview Endpoint 500 Error")
     print("=" * 50)
     
+    # The three probes are independent, so run them concurrently and
+    # report on them in order below
+    probes = prefetch_probes()
+    
     # Test backend health
-    backend_running = test_health_endpoint()
+    backend_running = test_health_endpoint(probes["health"])
     
     if backend_running:
         # Test reports health
-        reports_healthy = test_reports_health()
+        reports_healthy = test_reports_health(probes["reports_health"])
         
         # Test preview endpoint
-        preview_working = test_preview_endpoint()
+        preview_working = test_preview_endpoint(probes["preview"])
         
         print("\n" + "=" * 50)
         print("SUMMARY:")
@@ -1,8 +1,16 @@
 """
 Test script to verify the preview endpoint is working
 """
+import atexit
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# Keep-alive session shared by every request this script makes
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
+_session.headers.update({"Content-Type": "application/json"})
+atexit.register(_session.close)
 
 def test_preview_endpoint():
     """Test the preview endpoint"""
@@ -13,17 +21,17 @@ def test_preview_endpoint():
     url = f"http://127.0.0.1:5000/api/reports/{case_id}/preview"
     
     headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
+        "Authorization": f"Bearer {token}"
     }
     
     try:
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers, timeout=10)
         print(f"Status Code: {response.status_code}")
-        print(f"Response: {response.text}")
+        body = response.text
+        print(f"Response: {body}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = json.loads(body)
             if data.get('success') and data.get('data'):
                 print("✅ Preview endpoint is working!")
                 print(f"Case: {data['data']['case']['title']}")
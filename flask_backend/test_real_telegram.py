@@ -4,7 +4,6 @@ Test real Telegram scraping with existing credentials
 """
 
 import asyncio
-import os
 import sys
 from dotenv import load_dotenv
 
@@ -18,15 +17,16 @@ async def test_real_telegram():
     print()
     
     try:
-        from services.telegram_scraper import TelegramScraper
+        from services.telegram_scraper import TelegramScraper, get_telegram_credentials
         
         # Create scraper
         scraper = TelegramScraper()
         
         # Check if we have credentials
-        api_id = os.environ.get('TELEGRAM_API_ID')
-        api_hash = os.environ.get('TELEGRAM_API_HASH')
-        phone = os.environ.get('TELEGRAM_PHONE_NUMBER')
+        creds = get_telegram_credentials()
+        api_id = creds['TELEGRAM_API_ID']
+        api_hash = creds['TELEGRAM_API_HASH']
+        phone = creds['TELEGRAM_PHONE_NUMBER']
         
         print(f"API ID: {api_id}")
         print(f"Phone: {phone}")
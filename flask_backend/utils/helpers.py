@@ -1,12 +1,60 @@
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union, Sequence, Iterator, Tuple
 import hashlib
 import re
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Patterns used by the text helpers, compiled once at import
+_SANITIZE_RE = re.compile(r'[^\w\s\.\,\!\?\-\_\:\;\(\)]')
+# One character class, the union of the old per-character alternation
+# (whose %XX branch was already covered by the $-_ range), so matching is
+# a linear scan with no backtracking between overlapping branches
+_URL_RE = re.compile(r'https?://[a-zA-Z0-9$-_@.&+!*\\(),]+')
+# ASCII code points _SANITIZE_RE removes, as a str.translate deletion table
+_SANITIZE_ASCII_TABLE = {i: None for i in range(128) if _SANITIZE_RE.match(chr(i))}
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_EMAIL_VALIDATE_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_URL_VALIDATE_RE = re.compile(r'^https?://[-\w.]+(?::[0-9]+)?(?:/[\w/.]*(?:\?[\w&=%.]*)?(?:#[\w.]*)?)?$')
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """
+    json.loads, through orjson when it is installed
+    
+    orjson rejects some input the json module accepts (NaN/Infinity,
+    integers beyond 64 bits, lone surrogates), so anything orjson refuses
+    is retried with json to keep the stdlib's results.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+def parse_and_validate(data: Union[str, bytes]) -> Tuple[bool, Any]:
+    """
+    Parse JSON once, reporting whether it was valid
+    
+    Args:
+        data: JSON string or bytes (e.g. request.get_data())
+        
+    Returns:
+        Tuple of (is_valid, parsed value or None)
+    """
+    try:
+        return True, _json_loads(data)
+    except (ValueError, TypeError):
+        return False, None
+
 def validate_json(data: str) -> bool:
     """
     Validate if a string is valid JSON
@@ -17,11 +65,7 @@ def validate_json(data: str) -> bool:
     Returns:
         True if valid JSON, False otherwise
     """
-    try:
-        json.loads(data)
-        return True
-    except (json.JSONDecodeError, TypeError):
-        return False
+    return parse_and_validate(data)[0]
 
 def safe_json_loads(data: str, default: Any = None) -> Any:
     """
@@ -34,11 +78,14 @@ def safe_json_loads(data: str, default: Any = None) -> Any:
     Returns:
         Parsed JSON data or default value
     """
-    try:
-        return json.loads(data)
-    except (json.JSONDecodeError, TypeError):
+    is_valid, value = parse_and_validate(data)
+    if not is_valid:
         logger.warning(f"Failed to parse JSON data: {data[:100]}...")
         return default
+    return value
+
+_DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+_DEFAULT_DATETIME_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})', re.ASCII)
 
 def format_datetime(dt: datetime, format_str: str = "%Y-%m-%d %H:%M:%S") -> str:
     """
@@ -67,28 +114,52 @@ def parse_datetime(date_str: str, format_str: str = "%Y-%m-%d %H:%M:%S") -> Opti
         Datetime object or None if parsing fails
     """
     try:
+        if format_str == _DEFAULT_DATETIME_FORMAT:
+            # Fast path for the default format; anything unusual (unpadded
+            # fields, say) still goes through strptime below
+            match = _DEFAULT_DATETIME_RE.fullmatch(date_str)
+            if match:
+                return datetime(*map(int, match.groups()))
         return datetime.strptime(date_str, format_str)
     except ValueError:
         logger.warning(f"Failed to parse datetime: {date_str}")
         return None
 
-def generate_hash(data: str, algorithm: str = 'sha256') -> str:
+# Hash constructors by algorithm name; anything else falls back to sha256
+_HASHERS = {
+    'md5': hashlib.md5,
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+}
+
+# Longest input generate_hash memoizes
+_HASH_CACHE_MAX_LENGTH = 4096
+
+def generate_hash(data: Union[str, bytes], algorithm: str = 'sha256') -> str:
     """
     Generate hash of data
     
     Args:
-        data: Data to hash
+        data: Data to hash (str is UTF-8 encoded, bytes-like is hashed as is)
         algorithm: Hash algorithm to use
         
     Returns:
         Hash string
     """
-    if algorithm == 'md5':
-        return hashlib.md5(data.encode()).hexdigest()
-    elif algorithm == 'sha1':
-        return hashlib.sha1(data.encode()).hexdigest()
-    else:
-        return hashlib.sha256(data.encode()).hexdigest()
+    # Short str/bytes keys (dedupe keys, identifiers) repeat often and are
+    # cheap to keep; large payloads are hashed without caching
+    if isinstance(data, (str, bytes)) and len(data) <= _HASH_CACHE_MAX_LENGTH:
+        return _cached_hash(data, algorithm)
+    return _hash(data, algorithm)
+
+def _hash(data: Union[str, bytes], algorithm: str) -> str:
+    """Hash data with the named algorithm, without caching"""
+    hasher = _HASHERS.get(algorithm, hashlib.sha256)
+    if isinstance(data, str):
+        data = data.encode()
+    return hasher(data).hexdigest()
+
+_cached_hash = lru_cache(maxsize=2048)(_hash)
 
 def sanitize_text(text: str, max_length: int = 1000) -> str:
     """
@@ -104,12 +175,17 @@ def sanitize_text(text: str, max_length: int = 1000) -> str:
     if not text:
         return ""
     
-    # Remove special characters but keep basic punctuation
-    sanitized = re.sub(r'[^\w\s\.\,\!\?\-\_\:\;\(\)]', '', text)
+    # Remove special characters but keep basic punctuation; pure ASCII
+    # text goes through the equivalent translate table
+    if text.isascii():
+        sanitized = text.translate(_SANITIZE_ASCII_TABLE)
+    else:
+        sanitized = _SANITIZE_RE.sub('', text)
     
-    # Limit length
+    # Limit length; a truncated result ends in "...", so only its start
+    # can need stripping
     if len(sanitized) > max_length:
-        sanitized = sanitized[:max_length] + "..."
+        return sanitized[:max_length].lstrip() + "..."
     
     return sanitized.strip()
 
@@ -123,8 +199,7 @@ def extract_urls(text: str) -> List[str]:
     Returns:
         List of URLs found
     """
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    return re.findall(url_pattern, text)
+    return _URL_RE.findall(text)
 
 def extract_emails(text: str) -> List[str]:
     """
@@ -136,21 +211,47 @@ def extract_emails(text: str) -> List[str]:
     Returns:
         List of email addresses found
     """
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(email_pattern, text)
+    return _EMAIL_RE.findall(text)
 
-def chunk_list(lst: List, chunk_size: int) -> List[List]:
+def extract_urls_batch(texts: List[str]) -> List[List[str]]:
     """
-    Split a list into chunks of specified size
+    Extract URLs from many texts
     
     Args:
-        lst: List to chunk
-        chunk_size: Size of each chunk
+        texts: Texts to extract URLs from
         
     Returns:
-        List of chunks
+        List of URL lists, one per text
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    # Every match contains "http", so texts without it skip the regex
+    return [_URL_RE.findall(text) if text and 'http' in text else [] for text in texts]
+
+def extract_emails_batch(texts: List[str]) -> List[List[str]]:
+    """
+    Extract email addresses from many texts
+    
+    Args:
+        texts: Texts to extract emails from
+        
+    Returns:
+        List of email lists, one per text
+    """
+    # Every match contains "@", so texts without it skip the regex
+    return [_EMAIL_RE.findall(text) if text and '@' in text else [] for text in texts]
+
+def chunk_list(lst: Sequence, chunk_size: int) -> Iterator[Sequence]:
+    """
+    Split a sequence into chunks of specified size, lazily
+    
+    Args:
+        lst: List (or other sequence) to chunk
+        chunk_size: Size of each chunk
+        
+    Yields:
+        Successive chunks; wrap in list() if all chunks are needed at once
+    """
+    for i in range(0, len(lst), chunk_size):
+        yield lst[i:i + chunk_size]
 
 def merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
     """
@@ -163,9 +264,7 @@ def merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
     Returns:
         Merged dictionary
     """
-    result = dict1.copy()
-    result.update(dict2)
-    return result
+    return dict1 | dict2
 
 def flatten_dict(d: Dict, parent_key: str = '', sep: str = '_') -> Dict:
     """
@@ -179,14 +278,21 @@ def flatten_dict(d: Dict, parent_key: str = '', sep: str = '_') -> Dict:
     Returns:
         Flattened dictionary
     """
-    items = []
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.extend(flatten_dict(v, new_key, sep=sep).items())
+    flattened = {}
+    # Walk nested levels with an explicit stack of item iterators instead
+    # of recursion; keys come out in the same order as a depth-first walk
+    stack = [(parent_key, iter(d.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for k, v in items:
+            new_key = f"{prefix}{sep}{k}" if prefix else k
+            if isinstance(v, dict):
+                stack.append((new_key, iter(v.items())))
+                break
+            flattened[new_key] = v
         else:
-            items.append((new_key, v))
-    return dict(items)
+            stack.pop()
+    return flattened
 
 def calculate_date_range(days: int = 30) -> tuple:
     """
@@ -196,12 +302,14 @@ def calculate_date_range(days: int = 30) -> tuple:
         days: Number of days to go back
         
     Returns:
-        Tuple of (start_date, end_date)
+        Tuple of (start_date, end_date), naive UTC like the model timestamps
     """
-    end_date = datetime.now()
+    end_date = datetime.utcnow()
     start_date = end_date - timedelta(days=days)
     return start_date, end_date
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human readable format
@@ -215,13 +323,15 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0B"
     
-    size_names = ["B", "KB", "MB", "GB", "TB"]
+    # Unit index straight from the bit length: every 10 bits is one 1024 step
     i = 0
-    while size_bytes >= 1024 and i < len(size_names) - 1:
-        size_bytes /= 1024.0
-        i += 1
+    if size_bytes >= 1024:
+        i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
     
-    return f"{size_bytes:.1f}{size_names[i]}"
+    return f"{size_bytes / (1 << (10 * i)):.1f}{_SIZE_UNITS[i]}"
+
+# Longest input validate_email/validate_url memoize
+_VALIDATE_CACHE_MAX_LENGTH = 2048
 
 def validate_email(email: str) -> bool:
     """
@@ -233,8 +343,16 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid email, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    # Repeated addresses hit the cache; long inputs are matched uncached
+    if len(email) <= _VALIDATE_CACHE_MAX_LENGTH:
+        return _cached_email_match(email)
+    return _email_match(email)
+
+def _email_match(email: str) -> bool:
+    """Match an email address against the pattern, without caching"""
+    return bool(_EMAIL_VALIDATE_RE.match(email))
+
+_cached_email_match = lru_cache(maxsize=4096)(_email_match)
 
 def validate_url(url: str) -> bool:
     """
@@ -246,8 +364,16 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid URL, False otherwise
     """
-    pattern = r'^https?://(?:[-\w.])+(?:\:[0-9]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:\#(?:[\w.])*)?)?$'
-    return bool(re.match(pattern, url))
+    # Repeated URLs hit the cache; long inputs are matched uncached
+    if len(url) <= _VALIDATE_CACHE_MAX_LENGTH:
+        return _cached_url_match(url)
+    return _url_match(url)
+
+def _url_match(url: str) -> bool:
+    """Match a URL against the pattern, without caching"""
+    return bool(_URL_VALIDATE_RE.match(url))
+
+_cached_url_match = lru_cache(maxsize=4096)(_url_match)
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     """
@@ -278,17 +404,19 @@ def create_pagination_info(page: int, per_page: int, total: int) -> Dict:
     Returns:
         Pagination information dictionary
     """
-    total_pages = (total + per_page - 1) // per_page
+    total_pages = -(-total // per_page)  # ceiling division
+    has_prev = page > 1
+    has_next = page < total_pages
     
     return {
         'page': page,
         'per_page': per_page,
         'total': total,
         'pages': total_pages,
-        'has_prev': page > 1,
-        'has_next': page < total_pages,
-        'prev_page': page - 1 if page > 1 else None,
-        'next_page': page + 1 if page < total_pages else None
+        'has_prev': has_prev,
+        'has_next': has_next,
+        'prev_page': page - 1 if has_prev else None,
+        'next_page': page + 1 if has_next else None
     }
 
 def log_function_call(func_name: str, args: Dict = None, kwargs: Dict = None):
@@ -300,11 +428,17 @@ def log_function_call(func_name: str, args: Dict = None, kwargs: Dict = None):
         args: Function arguments
         kwargs: Function keyword arguments
     """
-    logger.debug(f"Function call: {func_name}")
+    # Skip all formatting when debug logging is off
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Function call: %s", func_name)
     if args:
-        logger.debug(f"Args: {args}")
+        logger.debug("Args: %s", args)
     if kwargs:
-        logger.debug(f"Kwargs: {kwargs}")
+        logger.debug("Kwargs: %s", kwargs)
+
+# Marks a missing key, so a stored None is not mistaken for one
+_MISSING = object()
 
 def safe_get_nested(data: Dict, keys: List[str], default: Any = None) -> Any:
     """
@@ -320,8 +454,9 @@ def safe_get_nested(data: Dict, keys: List[str], default: Any = None) -> Any:
     """
     current = data
     for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
+        if not isinstance(current, dict):
+            return default
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
             return default
     return current 
\ No newline at end of file